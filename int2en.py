@@ -1,7 +1,9 @@
 #!python3
-import numpy as np
-
-base = 10
+import random
+import sys
+from collections import namedtuple
+from functools import lru_cache, partial
+from operator import index
 
 NumType = int
 
@@ -13,9 +15,25 @@ class Scale:
 
     grouping = 3
 
+    VOCAB = {100: 'hundred', 1000: 'thousand'}
+
+    # Every power of ten named beyond 'thousand', in ascending order,
+    # and its name
+    _ILLION_POWERS = ()
+    _ILLION_NAMES = ()
+
+    # The name for each group of three digits, least significant first
+    SCALE_NAMES = ('', 'thousand')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Build each scale's vocabulary just once, as the class is defined
+        cls.VOCAB = Scale.VOCAB | dict(zip(cls._ILLION_POWERS, cls._ILLION_NAMES))
+        cls.SCALE_NAMES = Scale.SCALE_NAMES + cls._ILLION_NAMES
+
     @classmethod
-    def vocabulary(cls):
-        return {100: 'hundred', 1000: 'thousand'}
+    def vocabulary(cls) -> dict:
+        return cls.VOCAB
 
     # million, billion, etc.
     prefixes = {
@@ -33,6 +51,7 @@ class Scale:
         12: 'duodec',
     }
 
+    # Kept as a public helper; `int2en` itself goes by `SCALE_NAMES`
     @classmethod
     def relevant_vocabulary(cls, x: int) -> dict:
         ''' Which vocabulary items are no greater than the integer `x`?
@@ -51,12 +70,9 @@ class ShortScale(Scale):
         '''
         return cls.grouping * n + cls.grouping
 
-    @classmethod
-    def vocabulary(cls):
-        return super().vocabulary() | {
-            10 ** cls.illion(n): f'{prefix}illion'
-            for n, prefix in cls.prefixes.items()
-        }
+    _ILLION_POWERS = tuple(10 ** (3 * n + 3) for n in Scale.prefixes)
+    _ILLION_NAMES = tuple(
+        sys.intern(f'{prefix}illion') for prefix in Scale.prefixes.values())
 
 
 class LongScale(Scale):
@@ -74,15 +90,12 @@ class LongScale(Scale):
         '''
         return 2 * cls.grouping * n + cls.grouping
 
-    @classmethod
-    def vocabulary(cls):
-        return super().vocabulary() | {
-            10 ** cls.illion(n): f'{prefix}illion'
-            for n, prefix in cls.prefixes.items()
-        } | {
-            10 ** cls.illiard(n): f'{prefix}illiard'
-            for n, prefix in cls.prefixes.items()
-        }
+    # Each n-illion followed by its n-illiard
+    _ILLION_POWERS = tuple(
+        10 ** (6 * n + k) for n in Scale.prefixes for k in (0, 3))
+    _ILLION_NAMES = tuple(
+        sys.intern(f'{prefix}{suffix}')
+        for prefix in Scale.prefixes.values() for suffix in ('illion', 'illiard'))
 
 
 def test_scales():
@@ -92,6 +105,17 @@ def test_scales():
     assert LongScale .illion(1) == 6
     assert LongScale .illion(2) == 12
 
+    for scale in (ShortScale, LongScale):
+        assert all(
+            10 ** scale.illion(n) in scale._ILLION_POWERS for n in scale.prefixes)
+    assert all(
+        10 ** LongScale.illiard(n) in LongScale._ILLION_POWERS for n in LongScale.prefixes)
+
+    for scale in (ShortScale, LongScale):
+        assert all(
+            scale.vocabulary()[1000 ** k] == name
+            for k, name in enumerate(scale.SCALE_NAMES) if k)
+
     assert ShortScale.vocabulary()[10 **  6] ==  'million'
     assert ShortScale.vocabulary()[10 **  9] ==  'billion'
     assert ShortScale.vocabulary()[10 ** 12] == 'trillion'
@@ -99,6 +123,53 @@ def test_scales():
     assert {v: k for k, v in LongScale.vocabulary().items()}['milliard'] \
         == {v: k for k, v in ShortScale.vocabulary().items()}['billion']
 
+    assert ShortScale.relevant_vocabulary(10 ** 6) \
+        == {100: 'hundred', 1000: 'thousand', 10 ** 6: 'million'}
+
+
+def test_int2en():
+
+    ordinal = lambda i, **kwargs: int2en(i, cardinal_or_ordinal=Ordinal, **kwargs)
+    assert ordinal(21) == 'twenty-first'
+    assert ordinal(100) == 'one hundredth'
+    assert ordinal(1000) == 'one thousandth'
+    assert ordinal(1021) == 'one thousand and twenty-first'
+    assert ordinal(1199) == 'one thousand, one hundred and ninety-ninth'
+    assert ordinal(10 ** 6) == 'one millionth'
+    assert ordinal(10 ** 42) == 'one thousand duodecillionth'
+    assert ordinal(21, two_part_strategy=bipartite2) == 'one and twentieth'
+    assert ordinal(40, two_part_strategy=bipartite2) == 'fortieth'
+
+    assert digitwise(1207) == 'one two zero seven'
+
+    spaced = partial(bipartite1, two_digit_linker=' ')
+    assert int2en(21, two_part_strategy=spaced) == 'twenty one'
+    assert int2en(1021, two_part_strategy=spaced) == 'one thousand and twenty one'
+    assert int2en(-21, two_part_strategy=partial(bipartite1, two_digit_linker=' '),
+                  cardinal_or_ordinal=Ordinal) == 'negative twenty first'
+
+    # Checked whatever the sign of the integer
+    for i in (-1, 0, 1):
+        try:
+            int2en(i, negative_or_minus='less')
+        except AssertionError:
+            pass
+        else:
+            raise AssertionError(f'accepted a bad negative_or_minus for {i}')
+
+    assert int2en_many([-21, 0, 10 ** 6], cardinal_or_ordinal=Ordinal) \
+        == ['negative twenty-first', 'zeroth', 'one millionth']
+    try:
+        int2en_many([2.9])
+    except TypeError:
+        pass
+    else:
+        raise AssertionError('int2en_many accepted a float')
+
+    int2en.cache_clear()
+    assert not _sub1000_tables and not _context.cache_info().currsize
+    assert int2en(1118) == 'one thousand, one hundred and eighteen'
+
 
 
 def bipartite1(q: int, r: int, *,
@@ -113,8 +184,8 @@ def bipartite1(q: int, r: int, *,
     '''
     part1 = tens[q]
     if not r:
-        return part1 + th() if cardinal_or_ordinal == Ordinal else part1
-    part2 = int2en(r)
+        return add_th(part1) if cardinal_or_ordinal == Ordinal else part1
+    part2 = _0_to_9[r][cardinal_or_ordinal]
     return f'{part1}{two_digit_linker}{part2}'
 
 
@@ -122,15 +193,104 @@ def bipartite2(q: int, r: int, *,
                cardinal_or_ordinal: NumType = Cardinal) -> str:
     ''' 21 -> 'one and twenty'
     '''
-    tens_part = tens[q]
+    tens_part = add_th(tens[q]) if cardinal_or_ordinal == Ordinal else tens[q]
     if not r:
-        return tens_part + th() if cardinal_or_ordinal == Ordinal else tens_part
-    ones_part = int2en(r)
+        return tens_part
+    ones_part = _0_to_9[r][Cardinal]
     return f'{ones_part} and {tens_part}'
 
 
 def digitwise(i: int):
-    return ' '.join(_0_to_9[int(digit)] for digit in str(i))
+    return ' '.join(_0_to_9[int(digit)][Cardinal] for digit in str(i))
+
+
+NEGATIVE_OR_MINUS = frozenset({'negative', 'minus'})
+
+
+# The options to `int2en`, bundled so as to be passed around as one argument
+Ctx = namedtuple('Ctx', [
+    'scale',
+    'two_part_strategy',
+    'thousands_separator',
+    'do_say_and', 'do_warn',
+    'negative_or_minus',
+    'cardinal_or_ordinal',
+    # What is said before the rest of a number,
+    # indexed by whether that rest is 100+
+    'separators',
+])
+
+
+@lru_cache(maxsize=256)
+def _context(scale: type, two_part_strategy, thousands_separator: str,
+             do_say_and: bool, do_warn: bool, negative_or_minus: str,
+             cardinal_or_ordinal: NumType) -> Ctx:
+    ''' Bundle up the options to `int2en`,
+        along with whatever can be worked out from them up front.
+        Being cached, this checks each combination of options just once.
+    '''
+    assert negative_or_minus in NEGATIVE_OR_MINUS
+    separators = (' and ' if do_say_and else ' ', f'{thousands_separator} ')
+    return Ctx(scale, two_part_strategy, thousands_separator,
+               do_say_and, do_warn, negative_or_minus, cardinal_or_ordinal,
+               separators)
+
+
+def _int2en_iter(i: int, ctx: Ctx) -> str:
+    ''' Spell out the non-negative integer `i` as it is read aloud:
+        one group of three digits at a time, most significant first,
+        each followed by its scale name.
+    '''
+
+    (scale, two_part_strategy, _, do_say_and, do_warn,
+     _, cardinal_or_ordinal, separators) = ctx
+
+    words = sub1000(two_part_strategy, do_say_and)
+    # For the last group to be spoken, which alone can be ordinal
+    last_words = sub1000(two_part_strategy, do_say_and, cardinal_or_ordinal)
+
+    # 0-999, as a direct table lookup
+    if i < 1000:
+        return last_words[i]
+
+    # 1000+
+
+    names = scale.SCALE_NAMES
+    top = len(names) - 1
+
+    # Peel off the groups of three digits, least significant first
+    n, groups = i, []
+    while n and len(groups) < top:
+        n, group = divmod(n, 1000)
+        groups.append(group)
+    if n:
+        # Whatever remains counts the greatest scale name
+        power_of_ten = 1000 ** top
+        if do_warn and n >= power_of_ten:
+            # We shall then be saying things like "billion billion"
+            print(f'Overflow: {i} = {n} × {power_of_ten} + {i - n * power_of_ten}')
+        groups.append(n)
+
+    # Only the last group to be spoken can be ordinal
+    last = next(k for k, group in enumerate(groups) if group)
+
+    parts = []
+    for k in range(len(groups) - 1, last - 1, -1):
+        group = groups[k]
+        if not group:
+            continue
+        if parts:
+            parts.append(separators[k > 0 or group >= 100])
+        if not k:
+            parts.append(last_words[group])
+            break
+        parts.append(words[group] if group < 1000 else _int2en_iter(
+            group, ctx._replace(cardinal_or_ordinal=Cardinal)))
+        parts.append(' ')
+        parts.append(add_th(names[k])
+                     if k == last and cardinal_or_ordinal == Ordinal
+                     else names[k])
+    return ''.join(parts)
 
 
 def int2en(i: int, *,
@@ -154,156 +314,122 @@ def int2en(i: int, *,
     `cardinal_or_ordinal`: e.g. "one" vs "first"
     '''
 
-    recurse = lambda i, co=cardinal_or_ordinal: int2en(
-        i,
-        scale=scale,
-        two_part_strategy=two_part_strategy,
-        thousands_separator=thousands_separator,
-        do_say_and=do_say_and, do_warn=do_warn,
-        negative_or_minus=negative_or_minus,
-        cardinal_or_ordinal=co)
-
-    if i < 0:
-        assert negative_or_minus in ('negative', 'minus')
-        return f'{negative_or_minus} {recurse(-i)}'
-
-    q, r = divmod(i, base)
-
-    # 0-9
-    if q == 0:
-        return _0_to_9[r][cardinal_or_ordinal]
-
-    # 10-19
-    if q == 1:
-        return _10_to_19[r][cardinal_or_ordinal]
-
-    # 20-99
-    if q in tens:
-        return two_part_strategy(q, r, cardinal_or_ordinal=cardinal_or_ordinal)
+    ctx = _context(scale, two_part_strategy, thousands_separator,
+                   do_say_and, do_warn, negative_or_minus, cardinal_or_ordinal)
+    return _signed(i, ctx)
 
-    # 100+
 
-    # Use the greatest relevant vocabulary item first
-    power_of_ten, name = max(scale.relevant_vocabulary(i).items())
-    q, r = divmod(i, power_of_ten)
-    if do_warn and q >= power_of_ten:
-        # We shall then be saying things like "billion billion"
-        print(f'Overflow: {i} = {q} × {power_of_ten} + {r}')
-    part1 = f'{recurse(q, co=Cardinal)} {name}'
-    if not r:
-        return part1 + th() if cardinal_or_ordinal == Ordinal else part1
-    part2 = recurse(r, co=cardinal_or_ordinal)
-    return f'{part1}{thousands_separator} {part2}' \
-        if scale.relevant_vocabulary(r) \
-        else f'{part1} and {part2}' \
-        if do_say_and \
-        else f'{part1} {part2}'
-
-
-class Suffix:
+def _signed(i: int, ctx: Ctx) -> str:
+    ''' `int2en` for the integer `i`, of either sign, given its options.
+    '''
 
-    def __str__(self) -> str:
-        raise NotImplementedError()
+    # Overflow warnings are printed as a side effect, so bypass the cache
+    impl = _int2en_pos.__wrapped__ if ctx.do_warn else _int2en_pos
 
-    def __radd__(self, root) -> str:
-        return f'{root}{self}'
+    if i < 0:
+        return f'{ctx.negative_or_minus} {impl(-i, ctx)}'
+    return impl(i, ctx)
 
 
-class st(Suffix):
-    ''' The ordinal suffix 'st', which occurs only in 'first'.
+@lru_cache(maxsize=4096)
+def _int2en_pos(i: int, ctx: Ctx) -> str:
+    ''' `int2en` for the non-negative integer `i`,
+        memoized on the integer and its options.
     '''
+    return _int2en_iter(i, ctx)
 
-    def __str__(self) -> str:
-        return 'st'
 
-class th(Suffix):
-    ''' The ordinal suffix 'th'.
+def _cache_clear():
+    ''' Forget everything memoized behind `int2en`:
+        its results, its contexts and the tables of the numbers 0-999.
     '''
+    _int2en_pos.cache_clear()
+    _context.cache_clear()
+    _sub1000_tables.clear()
 
-    def __str__(self) -> str:
-        return 'th'
 
-    def __radd__(th, root) -> str:
+int2en.cache_clear = _cache_clear
 
-        if root.endswith('ve'):
-            # 'five' -> 'fifth'
-            # 'twelve' -> 'twelfth'
-            return f'{root.removesuffix('ve')}f{th}'
 
-        if root.endswith('ne'):
-            # 'nine' -> 'ninth'
-            return f'{root.removesuffix('e')}{th}'
+def int2en_many(xs, **options) -> list:
+    ''' `int2en` for each of the integers `xs`, all with the same `options`.
+    '''
+    ctx = _context(**int2en.__kwdefaults__ | options)
+    # `index` takes numpy integers too, but not floats
+    return [_signed(x, ctx) for x in map(index, xs)]
 
-        if root.endswith('ght'):
-            # 'eight' -> 'eighth'
-            return f'{root.removesuffix('t')}{th}'
 
-        if root.endswith('y'):
-            # 'sixty' -> 'sixtieth'
-            return f'{root.removesuffix('y')}ie{th}'
+def add_th(root: str) -> str:
+    ''' Append the ordinal suffix 'th'.
+    '''
 
-        return super().__radd__(root)
+    if root.endswith('ve'):
+        # 'five' -> 'fifth'
+        # 'twelve' -> 'twelfth'
+        return root[:-2] + 'fth'
 
+    if root.endswith('ne'):
+        # 'nine' -> 'ninth'
+        return root[:-1] + 'th'
 
-class teen(Suffix):
+    if root.endswith('ght'):
+        # 'eight' -> 'eighth'
+        return root[:-1] + 'th'
 
-    def __str__(self) -> str:
-        return 'teen'
+    if root.endswith('y'):
+        # 'sixty' -> 'sixtieth'
+        return root[:-1] + 'ieth'
 
-    def __radd__(teen, root) -> str:
+    return root + 'th'
 
-        if root.endswith('ve'):
-            # 'five' -> 'fifteen'
-            return f'{root.removesuffix('ve')}f{teen}'
 
-        if root.endswith('ght'):
-            # 'eight' -> 'eighteen'
-            return f'{root.removesuffix('t')}{teen}'
+def add_teen(root: str) -> str:
 
-        return super().__radd__(root)
+    if root.endswith('ve'):
+        # 'five' -> 'fifteen'
+        return root[:-2] + 'fteen'
 
+    if root.endswith('ght'):
+        # 'eight' -> 'eighteen'
+        return root[:-1] + 'teen'
 
-class ty(Suffix):
+    return root + 'teen'
 
-    def __str__(self) -> str:
-        return 'ty'
 
-    def __radd__(ty, root) -> str:
+def add_ty(root: str) -> str:
 
-        if root.endswith('ve'):
-            # 'five' -> 'fifty'
-            return f'{root.removesuffix('ve')}f{ty}'
+    if root.endswith('ve'):
+        # 'five' -> 'fifty'
+        return root[:-2] + 'fty'
 
-        if root.endswith('ght'):
-            # 'eight' -> 'eighty'
-            return f'{root.removesuffix('t')}{ty}'
+    if root.endswith('ght'):
+        # 'eight' -> 'eighty'
+        return root[:-1] + 'ty'
 
-        return super().__radd__(root)
+    return root + 'ty'
 
 
-_0_to_9 = {
+# Each of these tables is a tuple, indexed directly by the integer
+_0_to_9 = (
     # TODO Offer choice of 'zero' vs 'nought'
     # TODO Offer choice of 'zeroth' vs 'zeroeth'
-    0: {Cardinal: 'zero',  Ordinal: 'zero'  + th()},
-    1: {Cardinal: 'one',   Ordinal: 'fir'   + st()},  # Not 'oneth'
-    2: {Cardinal: 'two',   Ordinal: 'second'      },  # Not 'twoth'
-    3: {Cardinal: 'three', Ordinal: 'third'       },  # Not 'threeth'
-    4: {Cardinal: 'four',  Ordinal: 'four'  + th()},
-    5: {Cardinal: 'five',  Ordinal: 'five'  + th()},
-    6: {Cardinal: 'six',   Ordinal: 'six'   + th()},
-    7: {Cardinal: 'seven', Ordinal: 'seven' + th()},
-    8: {Cardinal: 'eight', Ordinal: 'eight' + th()},
-    9: {Cardinal: 'nine',  Ordinal: 'nine'  + th()},
-}
-
-_10_to_19 = {
-    i: {
-        Cardinal: card,
-        Ordinal:  card + th(),
-    } for i, card in ({
+    ('zero',  add_th('zero') ),
+    ('one',   'first'        ),  # Not 'oneth'
+    ('two',   'second'       ),  # Not 'twoth'
+    ('three', 'third'        ),  # Not 'threeth'
+    ('four',  add_th('four') ),
+    ('five',  add_th('five') ),
+    ('six',   add_th('six')  ),
+    ('seven', add_th('seven')),
+    ('eight', add_th('eight')),
+    ('nine',  add_th('nine') ),
+)
+
+_10_to_19 = tuple(
+    (card, add_th(card)) for _, card in sorted(({
         # The 'teens'
-        i: root + teen() for i, root in ({
-            i: item[Cardinal] for i, item in _0_to_9.items()
+        i: add_teen(root) for i, root in ({
+            i: item[Cardinal] for i, item in enumerate(_0_to_9)
         } | {
             3: 'thir',  # Not 'threeteen'
         }).items()
@@ -311,28 +437,95 @@ _10_to_19 = {
         0: 'ten',     # Not 'zeroteen'
         1: 'eleven',  # Not 'oneteen'
         2: 'twelve',  # Not 'twoteen'
-    }).items()
-}
+    }).items())
+)
 
-tens = {
-    i: root + ty() for i, root in ({
-        i: item[Cardinal] for i, item in _0_to_9.items() if i > 0
+tens = tuple(root for _, root in sorted(({
+    i: add_ty(root) for i, root in ({
+        i: item[Cardinal] for i, item in enumerate(_0_to_9) if i > 0
     } | {
         2: 'twen',  # Not 'twoty'
         3: 'thir',  # Not 'threety'
         4: 'for',   # Not 'fourty'
     }
 ).items()} | {
+    0: None,
     1: _10_to_19[0][Cardinal],  # Not 'onety'
-    # 11: _10_to_19[1][Cardinal] + ty(),
-}
+    # 11: add_ty(_10_to_19[1][Cardinal]),
+}).items()))
+
+hundreds = (None,) + tuple(
+    f'{item[Cardinal]} hundred' for item in _0_to_9[1:]
+)
+
+
+def _build(i: int, two_part_strategy=bipartite1, do_say_and: bool = True,
+           cardinal_or_ordinal: NumType = Cardinal) -> str:
+    ''' Spell out `0 <= i < 1000` from scratch, from its three digits.
+    '''
+    h, rem = divmod(i, 100)
+    t, o = divmod(rem, 10)
+
+    if h and not rem:
+        return add_th(hundreds[h]) if cardinal_or_ordinal == Ordinal else hundreds[h]
+
+    if t == 0:
+        part2 = _0_to_9[o][cardinal_or_ordinal]
+    elif t == 1:
+        part2 = _10_to_19[o][cardinal_or_ordinal]
+    else:
+        part2 = two_part_strategy(t, o, cardinal_or_ordinal=cardinal_or_ordinal)
+
+    if not h:
+        return part2
+    return f'{hundreds[h]} and {part2}' if do_say_and else f'{hundreds[h]} {part2}'
+
+
+class _Untabulated:
+    ''' Stands in for a table of the numbers 0-999,
+        spelling out each number only as it is looked up.
+    '''
+
+    def __init__(self, *options):
+        self.options = options
+
+    def __getitem__(self, i: int) -> str:
+        return _build(i, *self.options)
+
+
+# One table of the numbers 0-999 per combination of options,
+# each built on first use
+_sub1000_tables = {}
+
+
+def sub1000(two_part_strategy=bipartite1, do_say_and: bool = True,
+            cardinal_or_ordinal: NumType = Cardinal) -> tuple:
+    ''' The numbers 0-999, so that `sub1000()[i]` spells out `i`.
+
+    Only the built-in two-part strategies are tabulated.
+    Any other (e.g. a `functools.partial` of `bipartite1`) may be
+    a new object on every call, so its words are spelled out on demand.
+    '''
+    if two_part_strategy not in (bipartite1, bipartite2):
+        return _Untabulated(two_part_strategy, do_say_and, cardinal_or_ordinal)
+    key = two_part_strategy, do_say_and, cardinal_or_ordinal
+    if key not in _sub1000_tables:
+        _sub1000_tables[key] = tuple(
+            _build(i, two_part_strategy, do_say_and, cardinal_or_ordinal)
+            for i in range(1000))
+    return _sub1000_tables[key]
+
+
+SUB1000 = sub1000()
+ORD_SUB1000 = sub1000(cardinal_or_ordinal=Ordinal)
 
 
 def demo(n: int = 10):
 
-    xs = np.abs(np.random.randn(n) * 1E3).astype(int)
-    for x in xs:
-        print(f'{x:,}: {int2en(x, cardinal_or_ordinal=Cardinal, two_part_strategy=bipartite1)}', end='\n\n')
+    xs = [random.randint(0, 10 ** 6) for _ in range(n)]
+    ens = int2en_many(xs, cardinal_or_ordinal=Cardinal, two_part_strategy=bipartite1)
+    for x, en in zip(xs, ens):
+        print(f'{x:,}: {en}', end='\n\n')
 
 
 if __name__ == '__main__':